@@ -5,8 +5,9 @@
 
 use crate::presets::PresetConfig;
 use std::collections::HashMap;
+use std::ffi::OsString;
 use std::fs;
-use std::io::Write;
+use std::io::{self, Write};
 use std::path::Path;
 
 /// Создать проект на основе конфигурации пресета
@@ -137,7 +138,7 @@ pub fn create_project(
                 .map_err(|e| format!("Failed to create parent directory for {:?}: {}", dest_path, e))?;
         }
         
-        fs::copy(&source_path, &dest_path)
+        copy_file_atomic(&source_path, &dest_path)
             .map_err(|e| format!("Failed to copy template {:?} to {:?}: {}", source_path, dest_path, e))?;
     }
     
@@ -172,26 +173,27 @@ pub fn create_project(
             .format("%Y-%m-%d %H:%M")
             .to_string();
         
-        // Подстановка значений в шаблон README
-        let mut readme_content = preset_config.readme_template.clone();
+        // Значения подстановок: имя плейсхолдера (без скобок) -> значение.
+        // Динамические поля добавляются первыми, чтобы встроенные имена имели приоритет.
+        let mut placeholders: HashMap<String, &str> = HashMap::new();
         
-        // Подстановка имени проекта
-        readme_content = readme_content.replace("{PROJECT_NAME}", project_name);
-        readme_content = readme_content.replace("{project_name}", project_name);
-        
-        // Подстановка даты создания
-        readme_content = readme_content.replace("{DATE}", &datetime);
-        readme_content = readme_content.replace("{date}", &datetime);
-        
-        // Подстановка значений динамических полей
+        // Значения динамических полей
         for (field_id, value) in dynamic_fields {
-            let placeholder = format!("{{{}}}", field_id.to_uppercase());
-            readme_content = readme_content.replace(&placeholder, value);
-            
-            let placeholder_lower = format!("{{{}}}", field_id.to_lowercase());
-            readme_content = readme_content.replace(&placeholder_lower, value);
+            placeholders.insert(field_id.to_uppercase(), value);
+            placeholders.insert(field_id.to_lowercase(), value);
         }
         
+        // Имя проекта
+        placeholders.insert("PROJECT_NAME".to_string(), project_name);
+        placeholders.insert("project_name".to_string(), project_name);
+        
+        // Дата создания
+        placeholders.insert("DATE".to_string(), &datetime);
+        placeholders.insert("date".to_string(), &datetime);
+        
+        // Подстановка значений в шаблон README за один проход
+        let readme_content = substitute_placeholders(&preset_config.readme_template, &placeholders);
+        
         // Добавить заголовок и дату в начало README
         let full_readme = format!(
             "# {}\n\nСоздано: {}\n\n## Что дальше\n{}",
@@ -211,3 +213,73 @@ pub fn create_project(
     Ok(log_lines)
 }
 
+/// Подставить значения плейсхолдеров в шаблон
+///
+/// Проходит по шаблону один раз и заменяет каждый `{name}`, для которого есть
+/// значение в `values`. Неизвестные плейсхолдеры остаются без изменений, а
+/// подставленные значения повторно не обрабатываются.
+///
+/// # Arguments
+///
+/// * `template` - исходный шаблон
+/// * `values` - значения подстановок по имени плейсхолдера (без фигурных скобок)
+///
+/// # Returns
+///
+/// Шаблон с подставленными значениями
+fn substitute_placeholders(template: &str, values: &HashMap<String, &str>) -> String {
+    let mut result = String::with_capacity(template.len());
+    let mut rest = template;
+    
+    while let Some(start) = rest.find('{') {
+        result.push_str(&rest[..start]);
+        let after = &rest[start + 1..];
+        
+        match after.find('}') {
+            Some(end) => match values.get(&after[..end]) {
+                Some(value) => {
+                    result.push_str(value);
+                    rest = &after[end + 1..];
+                }
+                None => {
+                    // Не плейсхолдер - оставить '{' и продолжить поиск после него
+                    result.push('{');
+                    rest = after;
+                }
+            },
+            None => {
+                result.push_str(&rest[start..]);
+                rest = "";
+            }
+        }
+    }
+    
+    result.push_str(rest);
+    result
+}
+
+/// Атомарно скопировать файл
+///
+/// Копирует `source` во временный скрытый файл `.<имя>.<pid>.tmp` рядом с назначением
+/// и затем переименовывает его в `dest`. Если процесс прервется во время копирования,
+/// в проекте не останется частично записанного шаблона. Скрытый префикс и идентификатор
+/// процесса в имени практически исключают совпадение с файлами пользователя в проекте.
+/// Само копирование выполняет `fs::copy`, который на Linux использует
+/// `copy_file_range`/`sendfile`.
+///
+/// # Arguments
+///
+/// * `source` - путь к файлу-источнику
+/// * `dest` - путь к файлу назначения (перезаписывается, если существует)
+fn copy_file_atomic(source: &Path, dest: &Path) -> io::Result<()> {
+    let mut tmp_name = OsString::from(".");
+    tmp_name.push(dest.file_name().unwrap_or_default());
+    tmp_name.push(format!(".{}.tmp", std::process::id()));
+    let tmp_path = dest.with_file_name(tmp_name);
+    
+    let result = fs::copy(source, &tmp_path).and_then(|_| fs::rename(&tmp_path, dest));
+    if result.is_err() {
+        fs::remove_file(&tmp_path).ok(); // Игнорируем ошибки удаления временного файла
+    }
+    result
+}
@@ -61,8 +61,8 @@ enum Msg {
     PresetsPathSelected(Option<PathBuf>),
     /// Завершена загрузка пресетов из GitHub
     PresetsDownloaded(Result<PathBuf, String>),
-    /// Загружен список доступных пресетов
-    PresetsLoaded(Result<Vec<String>, String>),
+    /// Загружен список доступных пресетов вместе с именами для отображения
+    PresetsLoaded(Result<Vec<(String, String)>, String>), // (preset_id, preset_name)
     /// Загружена конфигурация выбранного пресета
     PresetConfigLoaded(Result<PresetConfig, String>),
     /// Обновить список доступных пресетов (загрузить заново из GitHub)
@@ -169,7 +169,10 @@ impl Application for AppState {
             (
                 state,
                 Command::perform(async move {
-                    discover_presets(&dir).map_err(|e| e.to_string())
+                    // Чтение конфигураций пресетов - синхронный ввод-вывод, выполняется в пуле блокирующих потоков
+                    tokio::task::spawn_blocking(move || discover_presets_with_names(&dir))
+                        .await
+                        .unwrap_or_else(|e| Err(e.to_string()))
                 }, |result| Msg::PresetsLoaded(result))
             )
         } else {
@@ -240,7 +243,9 @@ impl Application for AppState {
                         let dir = dir.clone();
                         self.log_lines.push(format!("Loading preset config: {} from {:?}", id, dir));
                         return Command::perform(async move {
-                            load_preset_config(&dir, &id).map_err(|e| e.to_string())
+                            tokio::task::spawn_blocking(move || load_preset_config(&dir, &id))
+                                .await
+                                .unwrap_or_else(|e| Err(e.to_string()))
                         }, |result| Msg::PresetConfigLoaded(result));
                     }
                 } else {
@@ -276,7 +281,9 @@ impl Application for AppState {
                         self.log_lines.push("Presets downloaded successfully. Scanning for available presets...".to_string());
                         // Загрузить список пресетов
                         return Command::perform(async move {
-                            discover_presets(&path).map_err(|e| e.to_string())
+                            tokio::task::spawn_blocking(move || discover_presets_with_names(&path))
+                                .await
+                                .unwrap_or_else(|e| Err(e.to_string()))
                         }, |result| Msg::PresetsLoaded(result));
                     }
                     Err(e) => {
@@ -289,16 +296,14 @@ impl Application for AppState {
             Msg::PresetsLoaded(result) => {
                 match result {
                     Ok(presets) => {
-                        self.available_presets = presets;
-                        // Загрузить имена пресетов для отображения
+                        // Имена для отображения уже загружены в фоновой команде
+                        self.available_presets.clear();
                         self.preset_names.clear();
                         self.preset_display_names.clear();
-                        if let Some(ref presets_dir) = self.presets_dir {
-                            for preset_id in &self.available_presets {
-                                let display_name = presets::get_preset_display_name(presets_dir, preset_id);
-                                self.preset_names.insert(preset_id.clone(), display_name.clone());
-                                self.preset_display_names.push(display_name);
-                            }
+                        for (preset_id, display_name) in presets {
+                            self.preset_names.insert(preset_id.clone(), display_name.clone());
+                            self.available_presets.push(preset_id);
+                            self.preset_display_names.push(display_name);
                         }
                         self.presets_initialized = true;
                         self.is_busy = false;
@@ -323,7 +328,6 @@ impl Application for AppState {
             Msg::PresetConfigLoaded(result) => {
                 match result {
                     Ok(config) => {
-                        self.preset_config = Some(config.clone());
                         self.log_lines.push(format!(
                             "Preset loaded: {} (fields: {}, options: {})",
                             config.name,
@@ -337,6 +341,7 @@ impl Application for AppState {
                                 opt.default,
                             );
                         }
+                        self.preset_config = Some(config);
                     }
                     Err(e) => {
                         self.log_lines.push(format!("Error loading preset config: {}", e));
@@ -385,17 +390,23 @@ impl Application for AppState {
                 self.dialog_start = Some(Instant::now());
                 
                 return Command::perform(async move {
-                    match create_project(
-                        &project_path,
-                        &presets_dir,
-                        &preset_config,
-                        &project_name,
-                        &dynamic_fields,
-                        &dynamic_options,
-                    ) {
-                        Ok(lines) => (lines, true),
-                        Err(e) => (vec![format!("Error: {}", e)], false),
-                    }
+                    // Создание проекта - синхронный файловый ввод-вывод, поэтому выполняется
+                    // в пуле блокирующих потоков Tokio, не занимая потоки асинхронного executor
+                    tokio::task::spawn_blocking(move || {
+                        match create_project(
+                            &project_path,
+                            &presets_dir,
+                            &preset_config,
+                            &project_name,
+                            &dynamic_fields,
+                            &dynamic_options,
+                        ) {
+                            Ok(lines) => (lines, true),
+                            Err(e) => (vec![format!("Error: {}", e)], false),
+                        }
+                    })
+                    .await
+                    .unwrap_or_else(|e| (vec![format!("Error: {}", e)], false))
                 }, |(lines, success)| Msg::ProcessFinished { lines, success });
             }
             Msg::ProcessFinished { lines, success } => {
@@ -440,12 +451,12 @@ impl Application for AppState {
     fn view(&self) -> Element<Self::Message> {
         // Выбор пресета - показываем человекочитаемые имена
         let preset_selector: Element<Msg> = if !self.available_presets.is_empty() {
-            // Создать копию данных для использования в замыкании
-            let presets_ids = self.available_presets.clone();
-            let preset_display_names = self.preset_display_names.clone();
+            // Замыкание заимствует данные состояния, копии списков не нужны
+            let presets_ids = &self.available_presets;
+            let preset_display_names = &self.preset_display_names;
             
             pick_list(
-                preset_display_names.clone(),
+                &preset_display_names[..],
                 self.selected_preset_display_name.as_ref(),
                 move |display_name: String| {
                     // Найти ID по индексу отображаемого имени
@@ -646,16 +657,23 @@ async fn main() -> iced::Result {
 /// assert!(!is_valid_project_name("")); // пустое имя
 /// ```
 fn is_valid_project_name(name: &str) -> bool {
-    use regex::Regex;
-    let ok = Regex::new(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$").unwrap().is_match(name);
+    // Эквивалент `^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$` одним проходом по байтам
+    let bytes = name.as_bytes();
+    let ok = match bytes.split_first() {
+        Some((first, rest)) => {
+            bytes.len() <= 64
+                && first.is_ascii_alphanumeric()
+                && rest.iter().all(|&b| b.is_ascii_alphanumeric() || matches!(b, b'.' | b'_' | b'-'))
+        }
+        None => false,
+    };
     if !ok { return false; }
     if name.ends_with('.') || name.ends_with(' ') { return false; }
     const RESERVED: &[&str] = &[
         "CON","PRN","AUX","NUL","COM1","COM2","COM3","COM4","COM5","COM6","COM7","COM8","COM9",
         "LPT1","LPT2","LPT3","LPT4","LPT5","LPT6","LPT7","LPT8","LPT9"
     ];
-    let upper = name.to_ascii_uppercase();
-    !RESERVED.iter().any(|&r| r == upper)
+    !RESERVED.iter().any(|r| r.eq_ignore_ascii_case(name))
 }
 
 /// Отправить системное уведомление о результате создания проекта
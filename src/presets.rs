@@ -23,6 +23,9 @@ pub const PRESETS_ZIP_URL: &str = "https://github.com/vladcraftcom/ai_prompt_pre
 /// Имя переменной окружения для хранения пути к директории пресетов
 pub const PRESETS_PATH_ENV_VAR: &str = "AI_PROJECT_TEMPLATE_PRESETS_PATH";
 
+/// Размер буфера записи при распаковке файлов из архива пресетов
+const EXTRACT_BUFFER_SIZE: usize = 64 * 1024;
+
 /// Конфигурация пресета проекта
 ///
 /// Описывает структуру проекта, который будет создан на основе этого пресета.
@@ -44,6 +47,16 @@ pub struct PresetConfig {
     pub options: Vec<OptionConfig>,
 }
 
+/// Заголовок конфигурации пресета
+///
+/// Содержит только поля, нужные для отображения списка пресетов.
+/// Остальные поля `files_config.json` при разборе пропускаются.
+#[derive(Debug, Deserialize)]
+struct PresetHeader {
+    #[serde(rename = "preset_name")]
+    name: String,
+}
+
 /// Конфигурация шаблона файла
 ///
 /// Описывает файл-шаблон, который будет скопирован из директории пресета
@@ -322,9 +335,34 @@ pub fn discover_presets(presets_dir: &Path) -> Result<Vec<String>, String> {
     Ok(presets)
 }
 
+/// Обнаружить пресеты и загрузить их имена для отображения
+///
+/// Объединяет `discover_presets` и `get_preset_display_name`, чтобы список пресетов
+/// и их имена можно было получить одной фоновой операцией.
+///
+/// # Arguments
+///
+/// * `presets_dir` - корневая директория со всеми пресетами
+///
+/// # Returns
+///
+/// `Ok(Vec<(String, String)>)` с парами (preset_id, preset_name),
+/// иначе `Err` с описанием ошибки
+pub fn discover_presets_with_names(presets_dir: &Path) -> Result<Vec<(String, String)>, String> {
+    let presets = discover_presets(presets_dir)?;
+    Ok(presets
+        .into_iter()
+        .map(|preset_id| {
+            let display_name = get_preset_display_name(presets_dir, &preset_id);
+            (preset_id, display_name)
+        })
+        .collect())
+}
+
 /// Получить имя пресета для отображения
 ///
-/// Загружает конфигурацию пресета и возвращает человекочитаемое имя (`preset_name`).
+/// Читает из `files_config.json` только человекочитаемое имя (`preset_name`),
+/// не разбирая шаблоны, поля и опции пресета.
 /// Если загрузка не удалась, возвращает идентификатор пресета.
 ///
 /// # Arguments
@@ -336,18 +374,22 @@ pub fn discover_presets(presets_dir: &Path) -> Result<Vec<String>, String> {
 ///
 /// Имя пресета для отображения (preset_name из конфига или preset_id как fallback)
 pub fn get_preset_display_name(presets_dir: &Path, preset_id: &str) -> String {
-    match load_preset_config(presets_dir, preset_id) {
-        Ok(config) => config.name,
-        Err(_) => preset_id.to_string(),
-    }
+    let config_path = presets_dir.join(preset_id).join("files_config.json");
+    
+    fs::read_to_string(&config_path)
+        .ok()
+        .and_then(|content| serde_json::from_str::<PresetHeader>(&content).ok())
+        .map(|header| header.name)
+        .unwrap_or_else(|| preset_id.to_string())
 }
 
 /// Скачать и распаковать пресеты из GitHub
 ///
 /// Обновляет пресеты из GitHub, не удаляя кастомные пресеты пользователя:
-/// 1. Скачивает ZIP архив из указанного URL
+/// 1. Скачивает ZIP архив из указанного URL в память
 /// 2. Распаковывает архив в целевую директорию (перезаписывая только файлы из архива)
-/// 3. Удаляет временный ZIP файл
+///
+/// Архив читается напрямую из загруженного буфера, без записи во временный файл.
 ///
 /// **Важно**: Эта функция не удаляет существующие пресеты. Она только обновляет/добавляет
 /// те пресеты, которые есть в архиве. Кастомные пресеты пользователя останутся нетронутыми.
@@ -386,29 +428,13 @@ pub async fn download_and_extract_presets(
         return Err(format!("HTTP error: {}", response.status()));
     }
     
-    // 3. Сохранить во временный файл в целевой директории
-    let temp_zip = target_dir.parent()
-        .unwrap_or(target_dir)
-        .join("presets_temp.zip");
-    
+    // 3. Прочитать архив в память (без промежуточного временного файла на диске)
     let bytes = response.bytes()
         .await
         .map_err(|e| format!("Failed to read response bytes: {}", e))?;
     
-    let mut file = fs::File::create(&temp_zip)
-        .map_err(|e| format!("Failed to create temp file {:?}: {}", temp_zip, e))?;
-    
-    file.write_all(&bytes)
-        .map_err(|e| format!("Failed to write temp file: {}", e))?;
-    file.sync_all()
-        .map_err(|e| format!("Failed to sync temp file: {}", e))?;
-    drop(file); // Закрыть файл перед распаковкой
-    
     // 4. Распаковать ZIP
-    let zip_file = fs::File::open(&temp_zip)
-        .map_err(|e| format!("Failed to open zip file {:?}: {}", temp_zip, e))?;
-    
-    let mut archive = zip::ZipArchive::new(zip_file)
+    let mut archive = zip::ZipArchive::new(io::Cursor::new(bytes))
         .map_err(|e| format!("Failed to open zip archive: {}", e))?;
     
     // Распаковать все файлы
@@ -441,12 +467,15 @@ pub async fn download_and_extract_presets(
                     .map_err(|e| format!("Failed to create parent dir {:?}: {}", parent, e))?;
             }
             
-            // Извлечь файл
-            let mut outfile = fs::File::create(&full_path)
+            // Извлечь файл (через буфер, чтобы запись шла крупными блоками, а не по 8 КБ)
+            let outfile = fs::File::create(&full_path)
                 .map_err(|e| format!("Failed to create file {:?}: {}", full_path, e))?;
+            let mut outfile = io::BufWriter::with_capacity(EXTRACT_BUFFER_SIZE, outfile);
             
             io::copy(&mut file, &mut outfile)
                 .map_err(|e| format!("Failed to extract file {:?}: {}", full_path, e))?;
+            outfile.flush()
+                .map_err(|e| format!("Failed to extract file {:?}: {}", full_path, e))?;
         }
         
         // Установить права доступа (для Unix)
@@ -460,10 +489,6 @@ pub async fn download_and_extract_presets(
         }
     }
     
-    // 5. Удалить временный ZIP файл
-    fs::remove_file(&temp_zip)
-        .ok(); // Игнорируем ошибки удаления
-    
     Ok(())
 }
 